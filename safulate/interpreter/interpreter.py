@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import re
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from dataclasses import fields, is_dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast
 
 from packaging.version import Version as _PackagingVersion
 
@@ -55,8 +57,8 @@ from ..parser import (
     ASTVisitor,
     ASTWhile,
     BinarySpec,
+    BoundStmts,
     CallSpec,
-    FormatSpec,
     IterableType,
     ParamType,
     UnarySpec,
@@ -75,6 +77,7 @@ from .objects import (
     SafModule,
     SafNum,
     SafObject,
+    SafProperty,
     SafStr,
     SafTuple,
     SafType,
@@ -84,17 +87,71 @@ from .objects import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
     from .libs.regex import SafPattern as _SafPattern
 
 __all__ = ("Interpreter",)
 
+_current_version = _PackagingVersion(__version__)
+_num_binary_ops: dict[BinarySpec, Callable[[float, float], SafBaseObject]] = {
+    BinarySpec.add: lambda left, right: SafNum(left + right),
+    BinarySpec.sub: lambda left, right: SafNum(left - right),
+    BinarySpec.mul: lambda left, right: SafNum(left * right),
+    BinarySpec.div: lambda left, right: SafNum(left / right),
+    BinarySpec.pow: lambda left, right: SafNum(left**right),
+    BinarySpec.eq: lambda left, right: true if left == right else false,
+    BinarySpec.neq: lambda left, right: true if left != right else false,
+    BinarySpec.less: lambda left, right: true if left < right else false,
+    BinarySpec.grtr: lambda left, right: true if left > right else false,
+    BinarySpec.lesseq: lambda left, right: true if left <= right else false,
+    BinarySpec.grtreq: lambda left, right: true if left >= right else false,
+}
+_num_compare_ops: dict[BinarySpec, Callable[[float, float], bool]] = {
+    BinarySpec.eq: lambda left, right: left == right,
+    BinarySpec.neq: lambda left, right: left != right,
+    BinarySpec.less: lambda left, right: left < right,
+    BinarySpec.grtr: lambda left, right: left > right,
+    BinarySpec.lesseq: lambda left, right: left <= right,
+    BinarySpec.grtreq: lambda left, right: left >= right,
+}
+_num_unary_ops: dict[UnarySpec, Callable[[float], SafBaseObject]] = {
+    UnarySpec.uadd: SafNum,
+    UnarySpec.neg: lambda right: SafNum(-right),
+}
+_scope_bound_nodes = (
+    ASTDel,
+    ASTEditObject,
+    ASTForLoop,
+    ASTFuncDecl,
+    ASTGetPriv,
+    ASTImportReq,
+    ASTPar,
+    ASTTryCatch,
+    ASTTypeDecl,
+    ASTVarDecl,
+)
+
+
+def _uses_scope(value: object) -> bool:
+    if isinstance(value, _scope_bound_nodes):
+        return True
+    if isinstance(value, list | tuple):
+        return any(_uses_scope(child) for child in cast("list[object]", value))
+    if isinstance(value, ASTNode) or is_dataclass(value):
+        return any(
+            _uses_scope(getattr(value, f.name))
+            for f in fields(value)  # pyright: ignore[reportArgumentType]
+            if f.init
+        )
+    return False
+
 
 class Interpreter(ASTVisitor):
     __slots__ = (
         "__cs_builtins__",
         "__cs_regex_pattern_cls__",
+        "dispatch",
         "env_stack",
         "libs",
         "module_obj",
@@ -102,10 +159,42 @@ class Interpreter(ASTVisitor):
     )
 
     def __init__(self, name: str, *, lib_manager: LibManager | None = None) -> None:
-        self.version = _PackagingVersion(__version__)
+        self.version = _current_version
         self.libs = lib_manager or LibManager()
         self.module_obj = SafModule(name)
         self.env_stack: list[SafBaseObject] = [self.module_obj]
+        self.dispatch: dict[type[ASTNode], Callable[[Any], SafBaseObject]] = {
+            ASTProgram: self.visit_program,
+            ASTBlock: self.visit_block,
+            ASTEditObject: self.visit_edit_object,
+            ASTIf: self.visit_if,
+            ASTWhile: self.visit_while,
+            ASTForLoop: self.visit_for_loop,
+            ASTReturn: self.visit_return,
+            ASTBreak: self.visit_break,
+            ASTContinue: self.visit_continue,
+            ASTExprStmt: self.visit_expr_stmt,
+            ASTVarDecl: self.visit_var_decl,
+            ASTFuncDecl: self.visit_func_decl,
+            ASTAssign: self.visit_assign,
+            ASTBinary: self.visit_binary,
+            ASTUnary: self.visit_unary,
+            ASTCall: self.visit_call,
+            ASTAtom: self.visit_atom,
+            ASTVersionReq: self.visit_version_req,
+            ASTImportReq: self.visit_import_req,
+            ASTRaise: self.visit_raise,
+            ASTDel: self.visit_del,
+            ASTTryCatch: self.visit_try_catch,
+            ASTSwitchCase: self.visit_switch_case,
+            ASTIterable: self.visit_iterable,
+            ASTFormat: self.visit_format,
+            ASTRegex: self.visit_regex,
+            ASTTypeDecl: self.visit_type_decl,
+            ASTPar: self.visit_get_par,
+            ASTGetPriv: self.visit_get_priv,
+            ASTDynamicID: self.visit_dynamic_id,
+        }
 
     @property
     def env(self) -> SafBaseObject:
@@ -115,7 +204,7 @@ class Interpreter(ASTVisitor):
     def name(self) -> str:
         return self.module_obj.name
 
-    @cached_property("regex_pattern_cls")
+    @cached_property("__cs_regex_pattern_cls__")
     def regex_pattern_cls(self) -> type[_SafPattern]:
         from .libs.regex import SafPattern
 
@@ -130,47 +219,132 @@ class Interpreter(ASTVisitor):
     def ctx(self, token: Token) -> NativeContext:
         return NativeContext(self, token)
 
-    @contextmanager
-    def scope(self, new: SafBaseObject | None = None) -> Iterator[SafBaseObject]:
+    def push_scope(self, new: SafBaseObject | None = None) -> SafBaseObject:
         if new is None:
             new = SafObject("temp scope")
             new.set_parent(self.env)
 
         self.env_stack.insert(0, new)
-        yield new
-        assert self.env_stack.pop(0) == new
+        return new
+
+    def pop_scope(self, scope: SafBaseObject) -> None:
+        assert self.env_stack.pop(0) == scope
+
+    @contextmanager
+    def scope(self, new: SafBaseObject | None = None) -> Iterator[SafBaseObject]:
+        new = self.push_scope(new)
+        try:
+            yield new
+        finally:
+            self.pop_scope(new)
 
     def visit_program(self, node: ASTProgram | ASTBlock) -> SafBaseObject:
         if len(node.stmts) <= 0:
             return null
-        for stmt in node.stmts[:-1]:
-            stmt.visit(self)
 
-        return node.stmts[-1].visit(self)
+        bound = self._bound_stmts(node)
+        for stmt in bound[1]:
+            stmt()
+        return bound[2]()
+
+    def visit_func_body(self, node: ASTBlock) -> SafBaseObject:
+        if len(node.stmts) <= 0:
+            return null
+
+        bound = self._bound_stmts(node)
+        for stmt in bound[1]:
+            stmt()
+
+        last = node.stmts[-1]
+        if type(last) is ASTReturn:
+            if last.expr is None:
+                return null
+            return self.dispatch[type(last.expr)](last.expr)
+
+        bound[2]()
+        return null
+
+    def _bound_stmts(self, node: ASTProgram | ASTBlock) -> BoundStmts:
+        bound = node.bound_stmts
+        if bound is None or bound[0] is not self:
+            stmts = [self._bind_stmt(stmt) for stmt in node.stmts]
+            bound = node.bound_stmts = (self, tuple(stmts[:-1]), stmts[-1])
+        return bound
+
+    def _bind_stmt(self, stmt: ASTNode) -> Callable[[], SafBaseObject]:
+        if isinstance(stmt, ASTExprStmt):
+            stmt = stmt.expr
+        return partial(self.dispatch[type(stmt)], stmt)
 
     def visit_block(self, node: ASTBlock) -> SafBaseObject:
-        with self.scope():
+        if node.needs_scope is None:
+            node.needs_scope = _uses_scope(node.stmts)
+        if not node.needs_scope:
+            return self.visit_program(node)
+
+        scope = self.push_scope()
+        try:
             return self.visit_program(node)
+        finally:
+            self.pop_scope(scope)
 
     def visit_edit_object(self, node: ASTEditObject) -> SafBaseObject:
-        src = node.obj.visit(self)
+        src = self.dispatch[type(node.obj)](node.obj)
         with self.scope(src):
             self.visit_program(node.block)
         return src
 
     def visit_if(self, node: ASTIf) -> SafBaseObject:
-        if node.condition.visit(self).bool_spec(self.ctx(node.kw_token)):
-            return node.body.visit(self)
+        dispatch = self.dispatch
+        condition = node.condition
+        ctx = NativeContext(self, node.kw_token)
+        if dispatch[type(condition)](condition).bool_spec(ctx):
+            return dispatch[type(node.body)](node.body)
         elif node.else_branch:
-            return node.else_branch.visit(self)
+            return dispatch[type(node.else_branch)](node.else_branch)
         return null
 
+    def _loop_condition(
+        self, condition: ASTNode, ctx: NativeContext
+    ) -> Callable[[], bool]:
+        visit_condition = self.dispatch[type(condition)]
+
+        def check() -> bool:
+            return visit_condition(condition).bool_spec(ctx)
+
+        if not (
+            type(condition) is ASTBinary
+            and condition.spec is not None
+            and (compare := _num_compare_ops.get(condition.spec))
+            and type(condition.left) is ASTAtom
+            and condition.left.token.type is TokenType.ID
+            and type(condition.right) is ASTAtom
+            and condition.right.token.type is TokenType.NUM
+        ):
+            return check
+
+        name_token = condition.left.token
+        name = name_token.lexme
+        right = condition.right.num_value
+
+        def check_num() -> bool:
+            left = self._get_var(name, name_token)
+            if type(left) is SafNum and not left.specs_loaded:
+                return compare(left.value, right)
+            return check()
+
+        return check_num
+
     def visit_while(self, node: ASTWhile) -> SafBaseObject:
+        ctx = self.ctx(node.kw_token)
+        body = node.body
+        check = self._loop_condition(node.condition, ctx)
+        visit_body = self.dispatch[type(body)]
         val = null
 
-        while node.condition.visit(self).bool_spec(self.ctx(node.kw_token)):
+        while check():
             try:
-                val = node.body.visit(self)
+                val = visit_body(body)
             except SafulateBreakoutError as e:
                 e.check()
                 break
@@ -181,25 +355,32 @@ class Interpreter(ASTVisitor):
 
     def visit_for_loop(self, node: ASTForLoop) -> SafBaseObject:
         ctx = self.ctx(node.kw_token)
-        src = ctx.invoke_spec(node.source.visit(self), CallSpec.iter)
-
+        invoke_spec = ctx.invoke_spec
+        next_spec = CallSpec.next
+        src = invoke_spec(self.dispatch[type(node.source)](node.source), CallSpec.iter)
+
+        attrs = self.env.public_attrs
+        name = node.vars.lexme if isinstance(node.vars, Token) else None
+        body = node.body
+        visit_body = self.dispatch[type(body)]
         val = null
         while 1:
             try:
-                item = ctx.invoke_spec(src, CallSpec.next)
+                item = invoke_spec(src, next_spec)
             except SafulateBreakoutError as e:
                 e.check()
                 break
 
             try:
-                self.env.public_attrs.update(
-                    self.unpack(node.vars, item, node.kw_token)
-                )
-                val = node.body.visit(self)
+                if name is None:
+                    attrs.update(self.unpack(node.vars, item, node.kw_token))
+                else:
+                    attrs[name] = item
+                val = visit_body(body)
             except SafulateInvalidContinue as e:
-                for _ in range(e.amount):
+                for _ in range(e.amount - 1):
                     try:
-                        item = ctx.invoke_spec(src, CallSpec.next)
+                        item = invoke_spec(src, next_spec)
                     except SafulateBreakoutError as e:
                         e.check()
                         break
@@ -211,7 +392,7 @@ class Interpreter(ASTVisitor):
 
     def visit_return(self, node: ASTReturn) -> SafBaseObject:
         if node.expr:
-            value = node.expr.visit(self)
+            value = self.dispatch[type(node.expr)](node.expr)
             raise SafulateInvalidReturn(value, node.keyword)
 
         raise SafulateInvalidReturn(null, node.keyword)
@@ -219,10 +400,10 @@ class Interpreter(ASTVisitor):
     def _visit_continue_and_break(self, node: ASTBreak | ASTContinue) -> SafBaseObject:
         is_break = isinstance(node, ASTBreak)
 
-        if node.amount is None:
-            amount = 1
-        else:
-            amount_node = node.amount.visit(self)
+        amount = node.const_amount
+        if amount is None:
+            assert node.amount is not None
+            amount_node = self.dispatch[type(node.amount)](node.amount)
             if not isinstance(amount_node, SafNum):
                 raise SafulateTypeError(
                     f"Expected a number for {'break' if is_break else 'continue'} amount, got {amount_node.repr_spec(self.ctx(node.keyword))} instead.",
@@ -251,14 +432,15 @@ class Interpreter(ASTVisitor):
         return self._visit_continue_and_break(node)
 
     def visit_expr_stmt(self, node: ASTExprStmt) -> SafBaseObject:
-        value = node.expr.visit(self)
-        return value
+        return self.dispatch[type(node.expr)](node.expr)
 
     def visit_var_decl(
         self,
         node: ASTVarDecl,
     ) -> SafBaseObject:
-        value = null if node.value is None else node.value.visit(self)
+        value = (
+            null if node.value is None else self.dispatch[type(node.value)](node.value)
+        )
 
         if isinstance(node.name, tuple):
             return SafTuple(
@@ -305,31 +487,33 @@ class Interpreter(ASTVisitor):
         scope: Token | None,
         declare: bool = False,
     ) -> SafBaseObject:
-        match scope:
-            case Token(type=TokenType.PUB) | None:
-                for env in self.env_stack:
-                    if declare or name in env.public_attrs:
-                        env.public_attrs[name] = value
-                        break
-                else:
-                    if name in self._builtins:
-                        self._builtins[name] = value
-                    else:
-                        raise SafulateNameError(f"Name {name!r} is not defined", scope)
-
-            case Token(type=TokenType.PRIV):
-                self.env.private_attrs[name] = value
-            case Token(lexme=SoftKeyword.SPEC.value):
-                try:
-                    spec = spec_name_from_str(name)
-                except ValueError:
-                    raise SafulateValueError(
-                        f"there is no spec named {name!r}", scope
-                    ) from None
-
-                self.env.specs[spec] = value
-            case _:
-                raise RuntimeError(f"Unknown var decl keyword: {scope!r}")
+        if scope is None or scope.type is TokenType.PUB:
+            if declare:
+                self.env.public_attrs[name] = value
+                return value
+
+            for env in self.env_stack:
+                attrs = env.public_attrs
+                if name in attrs:
+                    attrs[name] = value
+                    return value
+
+            if name not in self._builtins:
+                raise SafulateNameError(f"Name {name!r} is not defined", scope)
+            self._builtins[name] = value
+        elif scope.type is TokenType.PRIV:
+            self.env.private_attrs[name] = value
+        elif scope.lexme == SoftKeyword.SPEC.value:
+            try:
+                spec = spec_name_from_str(name)
+            except ValueError:
+                raise SafulateValueError(
+                    f"there is no spec named {name!r}", scope
+                ) from None
+
+            self.env.specs[spec] = value
+        else:
+            raise RuntimeError(f"Unknown var decl keyword: {scope!r}")
         return value
 
     def visit_func_decl(self, node: ASTFuncDecl) -> SafBaseObject:
@@ -347,114 +531,186 @@ class Interpreter(ASTVisitor):
         )
 
     def visit_assign(self, node: ASTAssign) -> SafBaseObject:
-        value = node.value.visit(self)
+        value = self.dispatch[type(node.value)](node.value)
         self._var_decl(node.name.resolve(self), value, scope=None)
         return value
 
     def visit_binary(self, node: ASTBinary) -> SafBaseObject:
-        left = node.left.visit(self)
-        right = node.right.visit(self)
-        ctx = self.ctx(node.op)
+        dispatch = self.dispatch
+        left = dispatch[type(node.left)](node.left)
+
+        spec = node.spec
+        if spec is None:
+            op_type = node.op.type
+            if op_type is TokenType.EQEQEQ:
+                right = dispatch[type(node.right)](node.right)
+                return true if left is right else false
+
+            ctx = NativeContext(self, node.op)
+            if op_type is TokenType.OR:
+                if left.bool_spec(ctx):
+                    return left
+                right = dispatch[type(node.right)](node.right)
+                return right if right.bool_spec(ctx) else null
+            elif op_type is TokenType.AND:
+                if not left.bool_spec(ctx):
+                    return false
+                right = dispatch[type(node.right)](node.right)
+                return true if right.bool_spec(ctx) else false
+            else:
+                raise ValueError(
+                    f"Invalid token type {op_type.name} for binary operator"
+                )
 
-        try:
-            spec = BinarySpec(node.op.type)
-        except ValueError as e:
-            match node.op.type:
-                case TokenType.OR:
-                    if left.bool_spec(ctx):
-                        return left
-                    if right.bool_spec(ctx):
-                        return right
-                    return null
-                case TokenType.AND:
-                    return (
-                        true if left.bool_spec(ctx) and right.bool_spec(ctx) else false
-                    )
-                case TokenType.EQEQEQ:
-                    return true if id(left) == id(right) else false
-                case _:
-                    raise ValueError(
-                        f"Invalid token type {node.op.type.name} for binary operator"
-                    ) from e
+        right = dispatch[type(node.right)](node.right)
+        if (
+            type(left) is SafNum
+            and type(right) is SafNum
+            and not left.specs_loaded
+            and (num_op := _num_binary_ops.get(spec))
+        ):
+            return num_op(left.value, right.value)
 
-        return ctx.invoke_spec(left, spec, right)
+        return NativeContext(self, node.op).invoke_spec(left, spec, right)
 
     def visit_unary(self, node: ASTUnary) -> SafBaseObject:
-        right = node.right.visit(self)
-        ctx = self.ctx(node.op)
+        right = self.dispatch[type(node.right)](node.right)
 
-        try:
-            spec = UnarySpec(node.op.type)
-        except ValueError as e:
+        spec = node.spec
+        if spec is None:
             if node.op.type is TokenType.NOT:
-                return false if right.bool_spec(ctx) else true
+                return false if right.bool_spec(NativeContext(self, node.op)) else true
             else:
                 raise ValueError(
                     f"Invalid token type {node.op.type.name} for unary operator"
-                ) from e
+                )
 
-        return self.ctx(node.op).invoke_spec(right, spec)
+        if (
+            type(right) is SafNum
+            and not right.specs_loaded
+            and (num_op := _num_unary_ops.get(spec))
+        ):
+            return num_op(right.value)
+
+        return NativeContext(self, node.op).invoke_spec(right, spec)
 
     def visit_call(self, node: ASTCall) -> SafBaseObject:
-        ctx = self.ctx(node.paren)
+        if node.attr_name is not None:
+            return self._visit_get_attr(node, node.attr_name)
+
+        ctx = NativeContext(self, node.paren)
+        dispatch = self.dispatch
+
+        arg_values = node.arg_values
+        if arg_values is not None:
+            if not arg_values:
+                pos_args = ()
+            elif len(arg_values) == 1:
+                arg = arg_values[0]
+                pos_args = (dispatch[type(arg)](arg),)
+            elif len(arg_values) == 2:
+                first, second = arg_values
+                pos_args = (
+                    dispatch[type(first)](first),
+                    dispatch[type(second)](second),
+                )
+            else:
+                pos_args = [dispatch[type(value)](value) for value in arg_values]
+
+            callee = dispatch[type(node.callee)](node.callee)
+            if (
+                type(callee) is SafFunc
+                and node.spec is CallSpec.call
+                and callee.has_native_spec(CallSpec.call)
+            ):
+                return ctx.invoke(callee, *pos_args)
+            return ctx.invoke_spec(callee, node.spec, *pos_args)
+
         args: list[SafBaseObject] = []
         kwargs: dict[str, SafBaseObject] = {}
 
         for param in node.params:
             match param.type:
                 case ParamType.arg:
-                    args.append(param.value.visit(self))
+                    args.append(dispatch[type(param.value)](param.value))
                 case ParamType.kwarg if param.name is not None:
-                    kwargs[param.name.resolve(self)] = param.value.visit(self)
+                    kwargs[param.name.resolve(self)] = dispatch[type(param.value)](
+                        param.value
+                    )
                 case ParamType.kwarg:
                     raise RuntimeError(f"Kwarg without name: {param!r}")
                 case ParamType.vararg:
-                    args.extend(param.value.visit(self).iter_spec(ctx))
+                    args.extend(
+                        self.dispatch[type(param.value)](param.value).iter_spec(ctx)
+                    )
                 case ParamType.varkwarg:
-                    val = param.value.visit(self)
+                    val = self.dispatch[type(param.value)](param.value)
                     if not isinstance(val, SafDict):
                         raise SafulateValueError(
                             f"Can not unpack, {val.repr_spec(ctx)} is not a dictionary"
                         )
-                    kwargs.update(
-                        {key.str_spec(ctx): value for key, value in val.data.values()}
-                    )
+                    for key, value in val.data.values():
+                        if type(key) is SafStr and not key.specs_loaded:
+                            kwargs[key.value] = value
+                        else:
+                            kwargs[key.str_spec(ctx)] = value
                 case _:
                     raise RuntimeError(f"Unhandled param: {param!r}")
 
-        return self.ctx(node.paren).invoke_spec(
-            node.callee.visit(self),
-            CallSpec(node.paren.type),
+        return ctx.invoke_spec(
+            dispatch[type(node.callee)](node.callee),
+            node.spec,
             *args,
             **kwargs,
         )
 
+    def _visit_get_attr(self, node: ASTCall, name: str) -> SafBaseObject:
+        obj = self.dispatch[type(node.callee)](node.callee)
+
+        if not obj.specs_loaded:
+            val = obj.public_attrs.get(name)
+            if (
+                val is not None
+                and not val.specs_loaded
+                and not isinstance(val, SafProperty)
+            ):
+                return val
+
+        return NativeContext(self, node.paren).invoke_spec(
+            obj, CallSpec.get_attr, SafStr(name)
+        )
+
     def _get_var(self, name: str, token: Token) -> SafBaseObject:
         for env in self.env_stack:
-            if name in env.public_attrs:
-                return env.public_attrs[name]
+            value = env.public_attrs.get(name)
+            if value is not None:
+                return value
 
-        if name in self._builtins:
-            return self._builtins[name]
-        else:
+        value = self._builtins.get(name)
+        if value is None:
             raise SafulateNameError(f"Name {name!r} is not defined", token)
+        return value
 
     def visit_atom(self, node: ASTAtom) -> SafBaseObject:
-        match node.token.type:
-            case TokenType.NUM:
-                return SafNum(float(node.token.lexme))
-            case TokenType.STR:
-                return SafStr(node.token.lexme)
-            case TokenType.ID:
-                return self._get_var(node.token.lexme, node.token)
-            case TokenType.TYPE:
-                return SafType.base_type()
-            case TokenType.ELLIPSIS:
-                return SafEllipsis()
-            case _:
-                raise ValueError(f"Invalid atom type {node.token.type.name}")
+        token = node.token
+        token_type = token.type
+        if token_type is TokenType.ID:
+            return self._get_var(node.name, token)
+        elif token_type is TokenType.NUM:
+            return SafNum(node.num_value)
+        elif token_type is TokenType.STR:
+            return SafStr(token.lexme)
+        elif token_type is TokenType.TYPE:
+            return SafType.base_type()
+        elif token_type is TokenType.ELLIPSIS:
+            return SafEllipsis()
+        else:
+            raise ValueError(f"Invalid atom type {token_type.name}")
 
     def visit_version_req(self, node: ASTVersionReq) -> SafBaseObject:
+        if node.satisfied_by is self.version:
+            return null
+
         match (node.left, node.op, node.right):
             case (_PackagingVersion() as ver, None, None):
                 left = str(ver)
@@ -491,6 +747,7 @@ class Interpreter(ASTVisitor):
             case _ as x:
                 raise RuntimeError(f"Unknown version req combination: {x!r}")
 
+        node.satisfied_by = self.version
         return null
 
     def visit_import_req(self, node: ASTImportReq) -> SafBaseObject:
@@ -513,122 +770,120 @@ class Interpreter(ASTVisitor):
         return value
 
     def visit_raise(self, node: ASTRaise) -> SafBaseObject:
-        val = node.expr.visit(self)
+        val = self.dispatch[type(node.expr)](node.expr)
         raise SafulateError(val.repr_spec(self.ctx(node.kw)), token=node.kw, obj=val)
 
     def visit_del(self, node: ASTDel) -> SafBaseObject:
+        name = node.var.lexme
         for parent in self.env.walk_parents(include_self=True):
-            if node.var.lexme in parent.public_attrs:
-                return parent.public_attrs.pop(node.var.lexme)
-        if node.var.lexme in self._builtins:
-            return self._builtins.pop(node.var.lexme)
+            value = parent.public_attrs.pop(name, None)
+            if value is not None:
+                return value
 
-        raise SafulateNameError(f"Name {node.var.lexme!r} is not defined")
+        value = self._builtins.pop(name, None)
+        if value is None:
+            raise SafulateNameError(f"Name {name!r} is not defined")
+        return value
 
     def visit_try_catch(self, node: ASTTryCatch) -> SafBaseObject:
         try:
-            node.body.visit(self)
+            self.dispatch[type(node.body)](node.body)
         except SafulateError as e:
             if not node.catch_branches:
                 return null
 
             for branch in node.catch_branches:
                 if branch.target is not None:
-                    target_token = branch.target[0]
-                    target = branch.target[1].visit(self)
+                    target_token, target_node = branch.target
+                    target = self.dispatch[type(target_node)](target_node)
+                    ctx = NativeContext(self, target_token)
 
                     if not isinstance(target, SafType):
                         raise SafulateTypeError(
-                            f"Expected Type object, got {target.repr_spec(self.ctx(target_token))} instead"
+                            f"Expected Type object, got {target.repr_spec(ctx)} instead"
                         )
-                    if not target.check(self.ctx(target_token), e.saf_value).bool_spec(
-                        self.ctx(target_token)
-                    ):
+                    if not target.check(ctx, e.saf_value).bool_spec(ctx):
                         continue
 
-                with self.scope():
+                scope = self.push_scope()
+                try:
                     if branch.var:
-                        self._var_decl(
-                            branch.var.lexme, e.saf_value, scope=None, declare=True
-                        )
+                        scope.public_attrs[branch.var.lexme] = e.saf_value
 
                     return self.visit_program(branch.body)
+                finally:
+                    self.pop_scope(scope)
             raise e
 
         if node.else_branch is None:
             return null
 
-        return node.else_branch.visit(self)
+        return self.dispatch[type(node.else_branch)](node.else_branch)
 
     def _visit_switch_case_entry(
-        self, body: ASTBlock, loops: list[tuple[ASTNode, ASTBlock]]
+        self, cases: list[tuple[ASTNode, ASTBlock]], idx: int
     ) -> SafBaseObject:
-        try:
-            return body.visit(self)
-        except SafulateInvalidContinue as e:
-            next_loop = None
-
-            while e.amount != 0:
-                try:
-                    next_loop = loops.pop(0)
-                except IndexError:
+        visit_block = self.dispatch[ASTBlock]
+        while True:
+            try:
+                return visit_block(cases[idx][-1])
+            except SafulateInvalidContinue as e:
+                idx += e.amount
+                if idx >= len(cases):
                     return null
-                e.amount -= 1
-
-            if next_loop is None:
-                return null
-
-            loops.insert(0, next_loop)
-            return self._visit_switch_case_entry(next_loop[-1], loops)
 
     def visit_switch_case(self, node: ASTSwitchCase) -> SafBaseObject:
-        key = node.expr.visit(self)
-        cases = node.cases.copy()
-
-        while cases:
-            expr, body = cases.pop(0)
-            ctx = self.ctx(node.kw)
+        dispatch = self.dispatch
+        key = dispatch[type(node.expr)](node.expr)
+        ctx = NativeContext(self, node.kw)
 
-            res = ctx.invoke_spec(key, BinarySpec.eq, expr.visit(self))
+        for idx, (expr, _) in enumerate(node.cases):
+            res = ctx.invoke_spec(key, BinarySpec.eq, dispatch[type(expr)](expr))
             if not res.bool_spec(ctx):
                 continue
 
-            self._visit_switch_case_entry(body, cases)
+            self._visit_switch_case_entry(node.cases, idx)
             return null
 
         if node.else_branch:
-            node.else_branch.visit(self)
+            self.dispatch[type(node.else_branch)](node.else_branch)
         return null
 
     def visit_iterable(self, node: ASTIterable) -> SafBaseObject:
+        dispatch = self.dispatch
+        items = [dispatch[type(child)](child) for child in node.children]
+
         match node.type:
             case IterableType.list:
-                return SafList([child.visit(self) for child in node.children])
+                return SafList(items)
             case IterableType.tuple:
-                return SafTuple(tuple(child.visit(self) for child in node.children))
+                return SafTuple(tuple(items))
             case _ as x:
                 raise RuntimeError(f"Unknown iterable {x!r}")
 
     def visit_format(self, node: ASTFormat) -> SafBaseObject:
         args: tuple[SafBaseObject, ...] = ()
 
-        try:
-            spec = FormatSpec(node.spec.lexme)
-        except ValueError:
+        spec = node.format_spec
+        if spec is None:
             args = (SafStr(node.spec.lexme),)
             spec = CallSpec.format
 
-        return self.ctx(node.spec).invoke_spec(node.obj.visit(self), spec, *args)
+        return self.ctx(node.spec).invoke_spec(
+            self.dispatch[type(node.obj)](node.obj), spec, *args
+        )
 
     def visit_regex(self, node: ASTRegex) -> SafBaseObject:
-        return self.regex_pattern_cls(re.compile(node.value.lexme[2:-1]))
+        if node.pattern is None:
+            node.pattern = re.compile(node.value.lexme[2:-1])
+        return self.regex_pattern_cls(node.pattern)
 
     def visit_type_decl(self, node: ASTTypeDecl) -> SafBaseObject:
         obj = SafType(
             node.name.lexme
             if isinstance(node.name, Token)
             else node.name.resolve(self),
-            init=node.init.visit(self) if node.init else None,
+            init=self.dispatch[type(node.init)](node.init) if node.init else None,
             arity=node.arity,
         )
         obj.set_parent(self.env)
@@ -637,19 +892,19 @@ class Interpreter(ASTVisitor):
             if node.body:
                 self.visit_program(node.body)
             if node.compare_func:
-                self.env["check"] = node.compare_func.visit(self)
+                self.env["check"] = self.dispatch[type(node.compare_func)](
+                    node.compare_func
+                )
 
         return obj
 
     def _get_scope_parent(self, levels: list[Token]) -> SafBaseObject:
-        _levels = levels.copy()
+        depth = len(levels)
         assert self.env
 
         for scope in self.env.walk_parents(include_self=True):
-            if _levels:
-                _levels.pop(0)
-
-            if not _levels:
+            depth -= 1
+            if depth <= 0:
                 return scope
 
         raise SafulateScopeError("Can't go any futher", levels[-1])
@@ -675,5 +930,7 @@ class Interpreter(ASTVisitor):
         return (
             node.token.lexme
             if node.expr is None
-            else node.expr.visit(self).str_spec(self.ctx(node.token))
+            else self.dispatch[type(node.expr)](node.expr).str_spec(
+                self.ctx(node.token)
+            )
         )
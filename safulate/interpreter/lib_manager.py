@@ -1,24 +1,28 @@
 from __future__ import annotations
 
-import runpy
+import importlib.util
+import sys
 from inspect import isfunction
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ..errors import SafulateImportError
 from .objects import SafModule
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .native_context import NativeContext
 
 __all__ = ("LibManager",)
 
 
 class LibManager:
-    __slots__ = ("cache",)
+    __slots__ = ("cache", "loaders")
 
     def __init__(self) -> None:
         self.cache: dict[str, SafModule] = {}
+        self.loaders: dict[Path, tuple[float, Callable[..., Any] | None]] = {}
 
     def __getitem__(self, key: str) -> SafModule | None:
         return self.cache.get(key)
@@ -26,10 +30,35 @@ class LibManager:
     def __setitem__(self, key: str, value: SafModule) -> None:
         self.cache[key] = value
 
+    def _get_loader(self, path: Path) -> Callable[..., Any] | None:
+        path = path.absolute()
+        mtime = path.stat().st_mtime
+        cached = self.loaders.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        name = f"_safulate_lib_{path.stem}_{abs(hash(str(path))):x}"
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None or spec.loader is None:
+            raise SafulateImportError("Module is invalid and could not be loaded")
+        module = importlib.util.module_from_spec(spec)
+
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(name, None)
+            raise
+
+        loader = getattr(module, "load", None)
+        if not isfunction(loader):
+            loader = None
+        self.loaders[path] = (mtime, loader)
+        return loader
+
     def load_lib(self, path: Path, *, ctx: NativeContext) -> SafModule:
-        globals = runpy.run_path(str(path.absolute()))
-        loader = globals.get("load")
-        if loader is None or not isfunction(loader):
+        loader = self._get_loader(path)
+        if loader is None:
             raise SafulateImportError("Module is invalid and could not be loaded")
 
         try:
@@ -40,7 +69,6 @@ class LibManager:
         if not isinstance(obj, SafModule):
             raise SafulateImportError("Module is invalid and could not be loaded")
 
-        self[obj.type.name] = obj
         return obj
 
     def load_builtin_lib(self, name: str, *, ctx: NativeContext) -> SafModule:
@@ -48,4 +76,6 @@ class LibManager:
         if not path.exists():
             raise SafulateImportError(f"Module {name!r} could not be found")
 
-        return self.load_lib(path, ctx=ctx)
+        module = self.load_lib(path, ctx=ctx)
+        self[name] = module
+        return module
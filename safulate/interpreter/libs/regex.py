@@ -254,7 +254,7 @@ class SafMatch(SafObject):
 
     @spec_meth(CallSpec.iter)
     def iter(self, ctx: NativeContext) -> SafIterator:
-        return SafIterator(x for x in self.groups(ctx).value)
+        return SafIterator(iter(self.groups(ctx).value))
 
     @spec_meth(UnarySpec.bool)
     def bool(self, ctx: NativeContext) -> SafBool:
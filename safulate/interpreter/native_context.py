@@ -46,7 +46,15 @@ class NativeContext:
         *args: SafBaseObject,
         **kwargs: SafBaseObject,
     ) -> SafBaseObject:
-        return self.invoke(func.specs[spec_name], *args, **kwargs)
+        member = func.native_spec_member(spec_name)
+        if member is None:
+            return self.invoke(func.specs[spec_name], *args, **kwargs)
+
+        try:
+            return func.call_native_member(self, member, args, kwargs)
+        except SafulateError as e:
+            e._add_token(self.token)
+            raise
 
     @property
     def env(self) -> SafBaseObject:
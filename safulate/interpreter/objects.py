@@ -9,6 +9,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Concatenate,
+    Literal,
     Self,
     TypedDict,
     TypeVar,
@@ -127,9 +128,14 @@ class _DefaultSpecs:
             Callable[Concatenate[SafBaseObject, NativeContext, ...], SafBaseObject],
         ] = {FormatSpec.repr: lambda obj, ctx: SafStr(f"<{obj.__class__.__name__}>")}
 
+        self.params: dict[SpecName, list[ASTFuncDecl_Param]] = {}
+
     def get(self, key: SpecName, *, obj: SafBaseObject) -> SafFunc:
-        raw_spec = self.raw_specs[key]
-        return SafFunc.from_native(key.name, partial_func(raw_spec, obj))
+        callback = partial_func(self.raw_specs[key], obj)
+        params = self.params.get(key)
+        if params is None:
+            params = self.params[key] = SafFunc.native_params(callback)
+        return SafFunc.from_native(key.name, callback, params=params)
 
     def get_from_str(self, key: str, *, obj: SafBaseObject) -> SafFunc:
         return self.get(key=spec_name_from_str(key), obj=obj)
@@ -151,6 +157,7 @@ class _DefaultSpecs:
 
 
 _default_specs = _DefaultSpecs()
+_native_params: dict[object, list[ASTFuncDecl_Param]] = {}
 
 # region Base
 
@@ -170,26 +177,109 @@ class SafBaseObject(ABC):
     def _attrs_hook(self, attrs: _RawAttrs) -> None:
         return
 
+    @classmethod
+    def _native_member_names(cls) -> tuple[str, ...]:
+        names = cls.__dict__.get("__safulate_native_members__")
+        if names is None:
+            names = tuple(
+                name
+                for name, _ in inspect.getmembers(
+                    cls, lambda attr: hasattr(attr, "__safulate_native_method__")
+                )
+            )
+            setattr(cls, "__safulate_native_members__", names)
+        return names
+
+    @classmethod
+    def _native_member_kinds(cls) -> frozenset[str]:
+        kinds: frozenset[str] | None = cls.__dict__.get("__safulate_native_kinds__")
+        if kinds is None:
+            kinds = frozenset(
+                getattr(getattr(cls, name), "__safulate_native_method__")[0]
+                for name in cls._native_member_names()
+            )
+            setattr(cls, "__safulate_native_kinds__", kinds)
+        return kinds
+
+    @classmethod
+    def _has_default_attrs_hook(cls) -> bool:
+        return cls._attrs_hook in (SafBaseObject._attrs_hook, SafObject._attrs_hook)
+
+    @classmethod
+    def _native_spec_members(cls) -> dict[SpecName, str]:
+        members: dict[SpecName, str] | None = cls.__dict__.get(
+            "__safulate_native_specs__"
+        )
+        if members is None:
+            members = {}
+            if cls._has_default_attrs_hook():
+                for name in cls._native_member_names():
+                    type_, spec, is_prop = getattr(
+                        getattr(cls, name), "__safulate_native_method__"
+                    )
+                    if type_ == "spec" and not is_prop:
+                        members[spec] = name
+            setattr(cls, "__safulate_native_specs__", members)
+        return members
+
+    @staticmethod
+    def _native_func_params(
+        value: Callable[Concatenate[NativeContext, ...], SafBaseObject],
+    ) -> list[ASTFuncDecl_Param]:
+        key = getattr(value, "__func__", value)
+        params = _native_params.get(key)
+        if params is None:
+            params = _native_params[key] = SafFunc.native_params(value)
+        return params
+
     @cached_property
     def _attrs(self) -> _RawAttrs:
         data: _RawAttrs = defaultdict(dict)  # pyright: ignore[reportAssignmentType, reportUnknownVariableType]
-        for name, _ in inspect.getmembers(
-            self.__class__, lambda attr: hasattr(attr, "__safulate_native_method__")
-        ):
+        for name in self._native_member_names():
             value = getattr(self, name)
 
             type_, func_name, is_prop = getattr(value, "__safulate_native_method__")
-            func = SafFunc.from_native(name, value)
+            func = SafFunc.from_native(
+                name, value, params=self._native_func_params(value)
+            )
             data[type_][func_name] = SafProperty(func) if is_prop else func
         self._attrs_hook(data)
         return data
 
+    def _lazy_attrs(self, kind: Literal["pub", "priv"]) -> dict[str, SafBaseObject]:
+        if (
+            "_attrs" in self.__dict__
+            or kind in self._native_member_kinds()
+            or not self._has_default_attrs_hook()
+        ):
+            return self._attrs[kind]
+
+        data: _RawAttrs = defaultdict(dict)  # pyright: ignore[reportAssignmentType, reportUnknownVariableType]
+        self._attrs_hook(data)
+        return data[kind]
+
+    def native_spec_member(self, name: SpecName) -> str | None:
+        if "specs" in self.__dict__:
+            return None
+        return self._native_spec_members().get(name)
+
+    def call_native_member(
+        self,
+        ctx: NativeContext,
+        member: str,
+        args: tuple[SafBaseObject, ...],
+        kwargs: dict[str, SafBaseObject],
+    ) -> SafBaseObject:
+        method = getattr(self, member)
+        SafFunc._validate_params(ctx, self._native_func_params(method), args, kwargs)
+        return method(ctx, *args, **kwargs)
+
     @cached_property
     def public_attrs(self) -> dict[str, SafBaseObject]:
         if self.__safulate_public_attrs__ is None:
             self.__safulate_public_attrs__ = {}
 
-        self.__safulate_public_attrs__.update(self._attrs["pub"])
+        self.__safulate_public_attrs__.update(self._lazy_attrs("pub"))
         return self.__safulate_public_attrs__
 
     @cached_property
@@ -197,7 +287,7 @@ class SafBaseObject(ABC):
         if self.__safulate_private_attrs__ is None:
             self.__safulate_private_attrs__ = {}
 
-        self.__safulate_private_attrs__.update(self._attrs["priv"])
+        self.__safulate_private_attrs__.update(self._lazy_attrs("priv"))
         return self.__safulate_private_attrs__
 
     @cached_property
@@ -210,6 +300,14 @@ class SafBaseObject(ABC):
             self.__safulate_specs__, partial_func(_default_specs.get, obj=self)
         )
 
+    @property
+    def specs_loaded(self) -> bool:
+        return "specs" in self.__dict__
+
+    def has_native_spec(self, name: SpecName) -> bool:
+        native = self._attrs["spec"].get(name)
+        return native is not None and self.specs[name] is native
+
     def __getitem__(self, key: str) -> SafBaseObject:
         try:
             return self.public_attrs[key]
@@ -383,7 +481,16 @@ class SafBaseObject(ABC):
         return self.run_spec(FormatSpec.hash, SafNum, ctx).value
 
     def bool_spec(self, ctx: NativeContext) -> bool:
+        if (self is true or self is false or self is null) and self.has_native_spec(
+            UnarySpec.bool
+        ):
+            return self is true
+
         val = self.run_spec(UnarySpec.bool, SafBool, ctx)
+        if val is true:
+            return True
+        if val is false:
+            return False
         if int(val.value) not in (1, 0):
             raise SafulateValueError(
                 f"expected return for bool spec to be a bool, got {val.repr_spec(ctx)} instead"
@@ -400,14 +507,25 @@ class SafBaseObject(ABC):
 
     @property
     def parent(self) -> SafBaseObject | None:
+        if not self.specs_loaded:
+            specs = self.__safulate_specs__
+            return None if specs is None else specs.get(AttrSpec.parent)
+
         if AttrSpec.parent in self.specs:
             return self.specs[AttrSpec.parent]
 
     def set_parent(self, parent: SafBaseObject | None) -> None:
+        if self.specs_loaded:
+            specs = self.specs
+        else:
+            if self.__safulate_specs__ is None:
+                self.__safulate_specs__ = {}
+            specs = self.__safulate_specs__
+
         if parent:
-            self.specs[AttrSpec.parent] = parent
+            specs[AttrSpec.parent] = parent
         else:
-            self.specs.pop(AttrSpec.parent, None)
+            specs.pop(AttrSpec.parent, None)
 
     def walk_parents(self, *, include_self: bool = False) -> Iterator[SafBaseObject]:
         if include_self:
@@ -1089,7 +1207,7 @@ class _SafIterable(SafObject):
 
     @spec_meth(CallSpec.iter)
     def iter(self, ctx: NativeContext) -> SafIterator:
-        return SafIterator(obj for obj in self.value)
+        return SafIterator(iter(self.value))
 
     @public_property("len")
     def len(self, ctx: NativeContext) -> SafNum:
@@ -1208,6 +1326,7 @@ class SafFunc(SafObject):
         self.partial_args = partial_args or ()
         self.partial_kwargs = partial_kwargs or {}
         self.__parent__ = parent
+        self.__scope_name__: tuple[SafBaseObject, str] | None = None
 
     @staticmethod
     def _resolve_default(
@@ -1238,26 +1357,28 @@ class SafFunc(SafObject):
         cls,
         ctx: NativeContext,
         params: list[ASTFuncDecl_Param],
-        init_args: tuple[SafBaseObject, ...],
+        args: tuple[SafBaseObject, ...],
         kwargs: dict[str, SafBaseObject],
     ) -> dict[str, SafBaseObject]:
-        args = list(init_args)
+        arg_idx = 0
+        arg_count = len(args)
+        kwargs = kwargs.copy()
         passable_params: dict[str, SafBaseObject] = {}
 
         for param in params:
             if param.type is ParamType.vararg:
-                passable_params[param.name.lexme] = SafList(args)
-                args = []
+                passable_params[param.name.lexme] = SafList(list(args[arg_idx:]))
+                arg_idx = arg_count
             elif param.type is ParamType.varkwarg:
                 passable_params[param.name.lexme] = SafDict.from_data(ctx, kwargs)
                 kwargs = {}
-            elif args:
+            elif arg_idx < arg_count:
                 if not param.is_arg:
                     raise SafulateValueError(
-                        f"Extra positional argument was passed: {args[0].repr_spec(ctx)}"
+                        f"Extra positional argument was passed: {args[arg_idx].repr_spec(ctx)}"
                     )
-                arg = args.pop(0)
-                passable_params[param.name.lexme] = arg
+                passable_params[param.name.lexme] = args[arg_idx]
+                arg_idx += 1
             elif kwargs:
                 if not param.is_kwarg:
                     passable_params[param.name.lexme] = cls._resolve_default(
@@ -1281,9 +1402,9 @@ class SafFunc(SafObject):
                     lambda: f"Required {param.type.to_arg_type_str()}argument was not passed: {param.name.lexme!r}",
                 )
 
-        if args:
+        if arg_idx < arg_count:
             raise SafulateValueError(
-                f"Received {len(args)} extra positional argument(s)."
+                f"Received {arg_count - arg_idx} extra positional argument(s)."
             )
         if kwargs:
             raise SafulateValueError(
@@ -1326,7 +1447,18 @@ class SafFunc(SafObject):
         )
 
     def get_scope(self, ctx: NativeContext) -> SafObject:
-        scope = SafObject(f"function scope @ {self.repr_spec(ctx)}")
+        name = self.public_attrs["name"]
+        if not (
+            self.has_native_spec(FormatSpec.repr)
+            and name.has_native_spec(FormatSpec.repr)
+        ):
+            scope_name = f"function scope @ {self.repr_spec(ctx)}"
+        else:
+            if self.__scope_name__ is None or self.__scope_name__[0] is not name:
+                self.__scope_name__ = (name, f"function scope @ {self.repr_spec(ctx)}")
+            scope_name = self.__scope_name__[1]
+
+        scope = SafObject(scope_name)
         scope.set_parent(self.__parent__)
         return scope
 
@@ -1334,32 +1466,29 @@ class SafFunc(SafObject):
     def call(
         self, ctx: NativeContext, *args: SafBaseObject, **kwargs: SafBaseObject
     ) -> SafBaseObject:
-        params = self.validate_params(
-            ctx,
-            *self.partial_args,
-            *args,
-            **self.partial_kwargs,
-            **kwargs,
-        )
+        if self.partial_args:
+            args = (*self.partial_args, *args)
+        if self.partial_kwargs:
+            duplicates = self.partial_kwargs.keys() & kwargs.keys()
+            if duplicates:
+                raise SafulateValueError(
+                    f"Recieved multiple values for keyword argument(s): {', '.join(sorted(duplicates))}"
+                )
+            kwargs = self.partial_kwargs | kwargs
 
-        if isinstance(self.body, Callable):
-            return self.body(
-                ctx,
-                *self.partial_args,
-                *args,
-                **self.partial_kwargs,
-                **kwargs,
-            )
+        params = self._validate_params(ctx, self.params, args, kwargs)
 
-        ret_value = null
-        with ctx.interpreter.scope(self.get_scope(ctx)):
-            for param, value in params.items():
-                ctx.interpreter._var_decl(param, value, scope=None, declare=True)
+        if isinstance(self.body, Callable):
+            return self.body(ctx, *args, **kwargs)
 
-            try:
-                ctx.interpreter.visit_program(self.body)
-            except SafulateInvalidReturn as r:
-                ret_value = r.value
+        scope = ctx.interpreter.push_scope(self.get_scope(ctx))
+        try:
+            scope.public_attrs.update(params)
+            ret_value = ctx.interpreter.visit_func_body(self.body)
+        except SafulateInvalidReturn as r:
+            ret_value = r.value
+        finally:
+            ctx.interpreter.pop_scope(scope)
 
         return ret_value
 
@@ -1381,30 +1510,38 @@ class SafFunc(SafObject):
     def without_partials(self, ctx: NativeContext) -> SafFunc:
         return self.with_partial_params((), {})
 
+    @staticmethod
+    def native_params(
+        callback: Callable[Concatenate[NativeContext, ...], SafBaseObject],
+    ) -> list[ASTFuncDecl_Param]:
+        raw_params = list(inspect.signature(callback).parameters.values())
+
+        return [
+            ASTFuncDecl_Param(
+                name=Token(TokenType.ID, param.name, -1),
+                default=None if param.default is param.empty else param.default,
+                type={
+                    param.VAR_POSITIONAL: ParamType.vararg,
+                    param.VAR_KEYWORD: ParamType.varkwarg,
+                    param.POSITIONAL_ONLY: ParamType.arg,
+                    param.KEYWORD_ONLY: ParamType.kwarg,
+                    param.POSITIONAL_OR_KEYWORD: ParamType.arg_or_kwarg,
+                }[param.kind],
+            )
+            for param in raw_params
+        ][1:]
+
     @classmethod
     def from_native(
         cls,
         name: str,
         callback: Callable[Concatenate[NativeContext, ...], SafBaseObject],
+        *,
+        params: list[ASTFuncDecl_Param] | None = None,
     ) -> SafFunc:
-        raw_params = list(inspect.signature(callback).parameters.values())
-
         return SafFunc(
             name=name,
-            params=[
-                ASTFuncDecl_Param(
-                    name=Token(TokenType.ID, param.name, -1),
-                    default=None if param.default is param.empty else param.default,
-                    type={
-                        param.VAR_POSITIONAL: ParamType.vararg,
-                        param.VAR_KEYWORD: ParamType.varkwarg,
-                        param.POSITIONAL_ONLY: ParamType.arg,
-                        param.KEYWORD_ONLY: ParamType.kwarg,
-                        param.POSITIONAL_OR_KEYWORD: ParamType.arg_or_kwarg,
-                    }[param.kind],
-                )
-                for param in raw_params
-            ][1:],
+            params=cls.native_params(callback) if params is None else params,
             body=callback,
         )
 
@@ -1534,7 +1671,7 @@ class SafDict(SafObject):
 
     @spec_meth(CallSpec.iter)
     def iter(self, ctx: NativeContext) -> SafIterator:
-        return SafIterator(obj for obj in self.keys(ctx).value)
+        return SafIterator(iter(self.keys(ctx).value))
 
     @spec_meth(BinarySpec.has_item)
     def has_item(self, ctx: NativeContext, other: SafBaseObject) -> SafBool:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from typing import Any, ClassVar, TypeAlias, TypeVar, overload
 
@@ -46,8 +47,6 @@ class Lexer:
             TokenType.TILDE,
             TokenType.AT,
             TokenType.NOT,
-            TokenType.AND,
-            TokenType.OR,
             TokenType.COLON,
             TokenType.AMP,
             TokenType.PIPE,
@@ -68,6 +67,8 @@ class Lexer:
             TokenType.MINUSEQ,
             TokenType.STAREQ,
             TokenType.SLASHEQ,
+            TokenType.AND,
+            TokenType.OR,
         )
     }
     trisymbol_tokens: ClassVar[dict[str, TokenType]] = {
@@ -304,7 +305,12 @@ class Lexer:
         if not char.isalnum():
             self.current -= 1
 
-        self.add_token(self.hard_keywords.get(self.snippit, TokenType.ID))
+        snippit = self.snippit
+        token_type = self.hard_keywords.get(snippit, TokenType.ID)
+        if token_type is TokenType.ID:
+            self.tokens.append(Token(token_type, sys.intern(snippit), self.start))
+        else:
+            self.add_token(token_type)
 
     @_(condition=lambda _lex, txt: txt if txt.isdigit() else None)
     def handle_num(self, char: str) -> None:
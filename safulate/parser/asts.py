@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, TypeAlias
 
 from ..lexer import Token, TokenType
 from .enums import IterableType, ParamType
+from .specs import BinarySpec, CallSpec, FormatSpec, UnarySpec
 
 if TYPE_CHECKING:
+    import re
+    from collections.abc import Callable
+
     from packaging.version import Version as _PackagingVersion
 
     from ..interpreter import SafBaseObject
 
 Unpackable: TypeAlias = tuple["Token | ASTDynamicID | Unpackable", ...]
+BoundStmts: TypeAlias = tuple[
+    "ASTVisitor",
+    tuple["Callable[[], SafBaseObject]", ...],
+    "Callable[[], SafBaseObject]",
+]
 
 __all__ = (
     "ASTAssign",
@@ -50,25 +60,32 @@ __all__ = (
     "ASTVersionReq",
     "ASTVisitor",
     "ASTWhile",
+    "BoundStmts",
     "ParamType",
     "Unpackable",
 )
 
 
 class ASTNode(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def visit(self, visitor: ASTVisitor) -> SafBaseObject: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTProgram(ASTNode):
     stmts: list[ASTNode]
 
+    bound_stmts: BoundStmts | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_program(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTDynamicID(ASTNode):
     token: Token
     expr: ASTNode | None
@@ -80,7 +97,7 @@ class ASTDynamicID(ASTNode):
         return visitor.resolve_dynamic_id(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTVarDecl(ASTNode):
     name: Unpackable | ASTDynamicID | Token
     value: ASTNode | None
@@ -90,7 +107,7 @@ class ASTVarDecl(ASTNode):
         return visitor.visit_var_decl(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTFuncDecl_Param:
     name: Token
     default: ASTNode | None | SafBaseObject
@@ -105,7 +122,7 @@ class ASTFuncDecl_Param:
         return self.type is ParamType.kwarg or self.type is ParamType.arg_or_kwarg
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTFuncDecl(ASTNode):
     name: Token | ASTDynamicID | None
     params: list[ASTFuncDecl_Param]
@@ -118,15 +135,23 @@ class ASTFuncDecl(ASTNode):
         return visitor.visit_func_decl(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTBlock(ASTNode):
     stmts: list[ASTNode]
 
+    bound_stmts: BoundStmts | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    needs_scope: bool | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_block(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTEditObject(ASTNode):
     obj: ASTNode
     block: ASTBlock
@@ -135,7 +160,7 @@ class ASTEditObject(ASTNode):
         return visitor.visit_edit_object(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTIf(ASTNode):
     condition: ASTNode
     body: ASTNode
@@ -146,7 +171,7 @@ class ASTIf(ASTNode):
         return visitor.visit_if(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTWhile(ASTNode):
     condition: ASTNode
     body: ASTNode
@@ -156,7 +181,7 @@ class ASTWhile(ASTNode):
         return visitor.visit_while(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTReturn(ASTNode):
     keyword: Token
     expr: ASTNode | None
@@ -165,25 +190,43 @@ class ASTReturn(ASTNode):
         return visitor.visit_return(self)
 
 
-@dataclass
+def _const_loop_amount(amount: ASTNode | None) -> int | None:
+    if amount is None:
+        return 1
+    if type(amount) is ASTAtom and amount.token.type is TokenType.NUM:
+        return int(amount.num_value)
+    return None
+
+
+@dataclass(slots=True)
 class ASTBreak(ASTNode):
     keyword: Token
     amount: ASTNode | None
 
+    const_amount: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.const_amount = _const_loop_amount(self.amount)
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_break(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTContinue(ASTNode):
     keyword: Token
     amount: ASTNode | None
 
+    const_amount: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.const_amount = _const_loop_amount(self.amount)
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_continue(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTExprStmt(ASTNode):
     expr: ASTNode
 
@@ -191,7 +234,7 @@ class ASTExprStmt(ASTNode):
         return visitor.visit_expr_stmt(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTAssign(ASTNode):
     name: ASTDynamicID
     value: ASTNode
@@ -201,26 +244,42 @@ class ASTAssign(ASTNode):
         return visitor.visit_assign(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTBinary(ASTNode):
     left: ASTNode
     op: Token
     right: ASTNode
 
+    spec: BinarySpec | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            self.spec = BinarySpec(self.op.type)
+        except ValueError:
+            self.spec = None
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_binary(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTUnary(ASTNode):
     op: Token
     right: ASTNode
 
+    spec: UnarySpec | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            self.spec = UnarySpec(self.op.type)
+        except ValueError:
+            self.spec = None
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_unary(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTCall_Param:
     type: ParamType
     name: ASTDynamicID | None
@@ -243,18 +302,32 @@ class ASTCall_Param:
         return cls(type=ParamType.varkwarg, name=None, value=value)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTCall(ASTNode):
     callee: ASTNode
     paren: Token
     params: list[ASTCall_Param]
 
+    attr_name: str | None = field(default=None, init=False, repr=False, compare=False)
+    spec: CallSpec = field(init=False, repr=False, compare=False)
+    arg_values: tuple[ASTNode, ...] | None = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.spec = CallSpec(self.paren.type)
+        self.arg_values = (
+            tuple(param.value for param in self.params)
+            if all(param.type is ParamType.arg for param in self.params)
+            else None
+        )
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_call(self)
 
     @classmethod
     def get_attr(cls, *, expr: ASTNode, dot: Token, attr: Token) -> ASTCall:
-        return cls(
+        node = cls(
             callee=expr,
             paren=dot,
             params=[
@@ -263,17 +336,28 @@ class ASTCall(ASTNode):
                 )
             ],
         )
+        node.attr_name = attr.lexme
+        return node
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTAtom(ASTNode):
     token: Token
 
+    num_value: float = field(init=False, repr=False, compare=False)
+    name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.token.type is TokenType.NUM:
+            self.num_value = float(self.token.lexme)
+        elif self.token.type is TokenType.ID:
+            self.name = sys.intern(self.token.lexme)
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_atom(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTVersionReq(ASTNode):
     keyword: Token
 
@@ -281,11 +365,15 @@ class ASTVersionReq(ASTNode):
     op: Token | None
     right: _PackagingVersion | None
 
+    satisfied_by: _PackagingVersion | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_version_req(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTImportReq(ASTNode):
     source: Token
     name: Token
@@ -294,7 +382,7 @@ class ASTImportReq(ASTNode):
         return visitor.visit_import_req(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTRaise(ASTNode):
     expr: ASTNode
     kw: Token
@@ -303,7 +391,7 @@ class ASTRaise(ASTNode):
         return visitor.visit_raise(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTForLoop(ASTNode):
     vars: Unpackable | Token
     source: ASTNode
@@ -314,7 +402,7 @@ class ASTForLoop(ASTNode):
         return visitor.visit_for_loop(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTDel(ASTNode):
     var: Token
 
@@ -322,14 +410,14 @@ class ASTDel(ASTNode):
         return visitor.visit_del(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTTryCatch_CatchBranch:
     body: ASTBlock
     target: tuple[Token, ASTNode] | None
     var: Token | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTTryCatch(ASTNode):
     body: ASTBlock
     catch_branches: list[ASTTryCatch_CatchBranch]
@@ -339,7 +427,7 @@ class ASTTryCatch(ASTNode):
         return visitor.visit_try_catch(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTSwitchCase(ASTNode):
     cases: list[tuple[ASTNode, ASTBlock]]
     else_branch: ASTBlock | None
@@ -350,7 +438,7 @@ class ASTSwitchCase(ASTNode):
         return visitor.visit_switch_case(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTIterable(ASTNode):
     children: list[ASTNode]
     type: IterableType
@@ -375,24 +463,36 @@ class ASTIterable(ASTNode):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTFormat(ASTNode):
     obj: ASTNode
     spec: Token
 
+    format_spec: FormatSpec | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            self.format_spec = FormatSpec(self.spec.lexme)
+        except ValueError:
+            self.format_spec = None
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_format(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTRegex(ASTNode):
     value: Token
 
+    pattern: re.Pattern[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def visit(self, visitor: ASTVisitor) -> SafBaseObject:
         return visitor.visit_regex(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTTypeDecl(ASTNode):
     name: Token | ASTDynamicID
     body: ASTBlock | None
@@ -405,7 +505,7 @@ class ASTTypeDecl(ASTNode):
         return visitor.visit_type_decl(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTPar(ASTNode):
     levels: list[Token]
 
@@ -413,7 +513,7 @@ class ASTPar(ASTNode):
         return visitor.visit_get_par(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTGetPriv(ASTNode):
     levels: list[Token]
     name: Token
@@ -108,6 +108,79 @@ reg_expr = _reg_deco_maker("expr")
 reg_stmt = _reg_deco_maker("stmt")
 _cases: list[RegisteredCase] = []
 
+_foldable_num_ops: dict[BinarySpec, Callable[[float, float], float]] = {
+    BinarySpec.add: lambda left, right: left + right,
+    BinarySpec.sub: lambda left, right: left - right,
+    BinarySpec.mul: lambda left, right: left * right,
+    BinarySpec.div: lambda left, right: left / right,
+    BinarySpec.pow: lambda left, right: left**right,
+}
+_foldable_num_unary_ops: dict[UnarySpec, Callable[[float], float]] = {
+    UnarySpec.uadd: lambda right: +right,
+    UnarySpec.neg: lambda right: -right,
+}
+
+
+def _num_literal(node: ASTNode) -> float | None:
+    if not isinstance(node, ASTAtom) or node.token.type is not TokenType.NUM:
+        return None
+    return node.num_value
+
+
+def _decode_str(lexme: str) -> str | None:
+    try:
+        return lexme.encode("ascii").decode("unicode_escape")
+    except UnicodeError:
+        return None
+
+
+def _fold_binary(node: ASTBinary) -> ASTNode:
+    if node.spec is BinarySpec.add and all(
+        isinstance(side, ASTAtom) and side.token.type is TokenType.STR
+        for side in (node.left, node.right)
+    ):
+        left = cast("ASTAtom", node.left).token
+        right = cast("ASTAtom", node.right).token
+
+        # at runtime each literal is decoded, then the joined result is decoded
+        # again, so only fold when the folded literal decodes to the same text
+        left_value = _decode_str(left.lexme)
+        right_value = _decode_str(right.lexme)
+        if left_value is None or right_value is None:
+            return node
+        folded = _decode_str(left.lexme + right.lexme)
+        if folded is None or folded != _decode_str(left_value + right_value):
+            return node
+        return ASTAtom(left.with_type(TokenType.STR, lexme=left.lexme + right.lexme))
+
+    op = _foldable_num_ops.get(node.spec) if node.spec else None
+    if op is None:
+        return node
+
+    left = _num_literal(node.left)
+    right = _num_literal(node.right)
+    if left is None or right is None:
+        return node
+
+    try:
+        value = op(left, right)
+    except ArithmeticError:
+        return node
+    if not isinstance(value, float):
+        return node
+    return ASTAtom(node.op.with_type(TokenType.NUM, lexme=repr(value)))
+
+
+def _fold_unary(node: ASTUnary) -> ASTNode:
+    op = _foldable_num_unary_ops.get(node.spec) if node.spec else None
+    if op is None:
+        return node
+
+    right = _num_literal(node.right)
+    if right is None:
+        return node
+    return ASTAtom(node.op.with_type(TokenType.NUM, lexme=repr(op(right))))
+
 
 class Parser:
     __slots__ = "__cs_expr_cases__", "__cs_stmt_cases__", "current", "tokens"
@@ -897,8 +970,10 @@ class Parser:
 
         node = parts.pop(0)
         while parts:
-            node = ASTBinary(
-                node, Token(TokenType.PLUS, "", start_token.start), parts.pop(0)
+            node = _fold_binary(
+                ASTBinary(
+                    node, Token(TokenType.PLUS, "", start_token.start), parts.pop(0)
+                )
             )
         return node
 
@@ -908,7 +983,7 @@ class Parser:
 
     @reg_expr((*UnarySpec.all_values(), *special_cased_unary_specs))
     def unary_ops(self) -> ASTNode:
-        return ASTUnary(op=self.advance(), right=self.expr())
+        return _fold_unary(ASTUnary(op=self.advance(), right=self.expr()))
 
     @reg_expr(TokenType.PAR)
     def par_atom(self) -> ASTPar:
@@ -1039,6 +1114,8 @@ class Parser:
                             ),
                         )
                     case _:
-                        return ASTBinary(left=left, op=token, right=self.expr())
+                        return _fold_binary(
+                            ASTBinary(left=left, op=token, right=self.expr())
+                        )
 
         return left
@@ -31,6 +31,9 @@ class FallbackDict(dict[KeyT, ValueT], Generic[KeyT, ValueT]):
 
 
 class Enum(_Enum):
+    # members are singletons compared by identity, so skip Enum's name-based hash
+    __hash__ = object.__hash__
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}.{self.name}"
 
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from safulate.interpreter import (
+    Interpreter,
+    LibManager,
+    NativeContext,
+    SafModule,
+    SafStr,
+)
+from safulate.lexer import Token, TokenType
+
+lib_code = """
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+from safulate.interpreter import SafModule, SafStr
+
+
+@dataclass
+class Holder:
+    kind: ClassVar[str] = {kind!r}
+
+
+def load(ctx):
+    return SafModule("holder", {{"kind": SafStr(Holder.kind)}})
+"""
+
+
+def _write_lib(path: Path, kind: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(lib_code.format(kind=kind))
+    return path
+
+
+def _load_kind(manager: LibManager, path: Path) -> str:
+    ctx = NativeContext(Interpreter("test"), Token.mock(TokenType.ID))
+    module = manager.load_lib(path, ctx=ctx)
+    assert isinstance(module, SafModule)
+
+    kind = module.public_attrs["kind"]
+    assert isinstance(kind, SafStr)
+    return kind.value
+
+
+def test_dataclass_classvar_lib(tmp_path: Path) -> None:
+    path = _write_lib(tmp_path / "holder.py", "first")
+
+    assert _load_kind(LibManager(), path) == "first"
+
+
+def test_libs_with_same_stem(tmp_path: Path) -> None:
+    first = _write_lib(tmp_path / "a" / "holder.py", "first")
+    second = _write_lib(tmp_path / "b" / "holder.py", "second")
+
+    manager = LibManager()
+    assert _load_kind(manager, first) == "first"
+    assert _load_kind(manager, second) == "second"